@@ -1,15 +1,48 @@
-import json
+from __future__ import annotations
+
+import math
+import os
+import re
 import subprocess
-import tkinter as tk
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime as dt
+from functools import reduce
+from importlib.util import find_spec
+from numbers import Number
 from pathlib import Path
-from tkinter import filedialog
-from typing import List, Union
+from typing import BinaryIO, Dict, Iterable, List, Optional, Set, TYPE_CHECKING, Tuple, Union
 
 import click
-import pandas as pd
-from dateutil.parser import parse
 
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Outside of type checking, pandas, numpy, dateutil & tkinter are comparatively slow to import, so
+# they're deferred to the functions that use them & only paid for when needed (e.g. not for --help)
+
+try:
+    from ciso8601 import parse_datetime as _fast_parse
+except ImportError:
+
+    def _fast_parse(timestamp: str) -> dt:
+        # fromisoformat only accepts the "Z" UTC designator from Python 3.11 onwards
+        return dt.fromisoformat(timestamp.replace("Z", "+00:00"))
+
+
+# GMetrixConverter doesn't zero-pad its date & time fields (e.g. "2019-8-18T17:17:14.999Z"), which
+# strict ISO 8601 parsers reject
+_UNPADDED_FIELD = re.compile(r"(?<=[-T:])(\d)(?=[-T:.Z+])")
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 PATH_TO_CONVERTER = Path(r"C:\Program Files\Garmin\VIRB Edit\GMetrixConverter.exe")
 SORT_ORDER = "eByType"  # -s flag
@@ -33,58 +66,227 @@ FIELDS_TO_EXPORT = {  # -d flag
     "eAltitudeUncertainty_4": "Altitude Uncertainty",
     "ePositionUncertainty_4": "Position Uncertainty",
 }
+# Exported types whose samples are a single number, rather than e.g. a position or 3D vector
+_SCALAR_TYPES = frozenset(FIELDS_TO_EXPORT.values()) - {
+    "Position",
+    "Acceleration (Filtered)",
+    "Gyroscope",
+    "3D Velocity (Recorded)",
+}
+OUTPUT_FORMATS = ("csv", "xlsx", "parquet")
+# Number of timestamps checked against the previous group's before searching it for every one
+_CACHE_PROBE_SIZE = 64
+LOG_FILENAME = ".virbpy.log"
+
+# GMetrixConverter arguments shared by every call, built once rather than per file
+_CONVERTER_STR = str(PATH_TO_CONVERTER)
+_CONVERTER_OPTIONS = ("-s", SORT_ORDER, "-d", *FIELDS_TO_EXPORT)
 
 
-def processing_pipeline(datadir: Path) -> None:
+def processing_pipeline(datadir: Path, sink: str = "csv", jobs: Optional[int] = None) -> List[Path]:
     """
-    Recursively search for *.fit files contained in the provided directory & convert to *.xlsx.
+    Recursively search for *.fit files contained in the provided directory & convert to a table.
+
+    Files are first converted to JSON using Garmin's GMetrix converter, then converted to the
+    table format specified by `sink` (one of `OUTPUT_FORMATS`).
+
+    Both conversion stages are run for up to `jobs` files concurrently. If `jobs` is not
+    specified, `os.cpu_count()` is used.
 
-    Files are first converted to JSON using Garmin's GMetrix converter, then converted to a *.xlsx
+    The outcome of each conversion is appended to a `LOG_FILENAME` log file in `datadir` as it
+    completes, and a list of the files that failed to convert is returned.
 
-    Note: *.fit files with an exactly named *.json partner in the same directory are ignored.
+    `FileNotFoundError` is raised if there are *.fit files to convert but `PATH_TO_CONVERTER`
+    does not exist, and `ImportError` is raised up front if parquet output is requested but
+    `pyarrow` is not installed.
+
+    Note: *.fit files with an exactly named *.json partner in the same directory are not passed
+    to the converter, and *.json files whose output table is at least as new as the JSON are not
+    converted again. Any other *.json partners found, not just newly converted ones, are converted;
+    *.json files without a *.fit partner are ignored.
     """
-    # Convert unconverted files to JSON & add to XLSX conversion queue
-    excel_conversion_queue = []
-    for fit_file in datadir.rglob("*.fit"):
-        # Check for existing conversion
-        file_as_json = fit_file.with_suffix(".json")
-        if file_as_json.exists():
-            continue
+    if sink == "parquet" and find_spec("pyarrow") is None:
+        raise ImportError("Parquet output requires pyarrow, install the 'parquet' extra")
+
+    jobs = jobs or os.cpu_count() or 1
+    log_filepath = datadir / LOG_FILENAME
+    failed = []
+
+    # Convert unconverted files to JSON
+    # The converter does its work in a subprocess, so threads are enough to run these in parallel
+    fit_files, json_files = _find_data_files(datadir)
+    to_convert = [fit for fit in fit_files if fit.with_suffix(".json") not in json_files]
+
+    # Check the converter once up front rather than failing the launch for every file
+    if to_convert and not PATH_TO_CONVERTER.is_file():
+        raise FileNotFoundError(f"Could not locate GMetrixConverter at '{PATH_TO_CONVERTER}'")
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = {executor.submit(call_converter, fit): fit for fit in to_convert}
+        for future in as_completed(pending):
+            fit_file = pending[future]
+            try:
+                future.result()
+            except (OSError, subprocess.SubprocessError) as e:
+                failed.append(fit_file)
+                _append_log(log_filepath, fit_file, e)
+            else:
+                json_files.add(fit_file.with_suffix(".json"))
+
+    # Queue any converter output without an up to date table, so interrupted or failed runs are
+    # picked back up; JSON files without a *.fit partner aren't GMetrixConverter output
+    # The table conversion is CPU bound, so it's spread across processes to sidestep the GIL
+    partnered_json = (fit_file.with_suffix(".json") for fit_file in fit_files)
+    table_conversion_queue = sorted(
+        json_file
+        for json_file in partnered_json
+        if json_file in json_files and not _is_converted(json_file, sink)
+    )
+    if table_conversion_queue:
+        n_workers = min(jobs, len(table_conversion_queue))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            pending = {
+                executor.submit(fit_json_to_table, json_file, sink): json_file
+                for json_file in table_conversion_queue
+            }
+            for future in as_completed(pending):
+                json_file = pending[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    failed.append(json_file)
+                    _append_log(log_filepath, json_file, e)
+                else:
+                    _append_log(log_filepath, json_file)
+
+    return failed
+
+
+def _is_converted(json_filepath: Path, sink: str) -> bool:
+    """Check whether the provided JSON file has an output table at least as new as itself."""
+    out_filepath = json_filepath.with_suffix(f".{sink}")
+    try:
+        return out_filepath.stat().st_mtime >= json_filepath.stat().st_mtime
+    except FileNotFoundError:
+        return False
+
+
+def _append_log(log_filepath: Path, filepath: Path, error: Optional[Exception] = None) -> None:
+    """
+    Append a timestamped, tab-separated `status filepath [error]` line for the provided result.
+
+    Results are logged as they come in, so an interrupted run still records its finished files.
+    """
+    timestamp = dt.now().isoformat(timespec="seconds")
+    with log_filepath.open("a") as f:
+        if error is None:
+            f.write(f"{timestamp}\tOK\t{filepath}\n")
         else:
-            call_converter(fit_file)
-            excel_conversion_queue.append(file_as_json)
+            f.write(f"{timestamp}\tFAILED\t{filepath}\t{error!r}\n")
+
 
-    # Convert queued JSON files to Excel
-    for new_json in excel_conversion_queue:
-        fit_json_to_excel(new_json)
+def _find_data_files(datadir: Path) -> Tuple[List[Path], Set[Path]]:
+    """
+    Recursively collect the *.fit and *.json files contained in the provided directory.
+
+    Each directory is listed once using `os.scandir`, so checking whether a *.fit file already
+    has a *.json partner is a set lookup rather than a stat call per file.
+    Directories that can't be read are skipped, as `Path.rglob` does.
+    """
+    fit_files = []
+    json_files = set()
+    to_scan = [datadir]
+    while to_scan:
+        try:
+            entries = os.scandir(to_scan.pop())
+        except PermissionError:
+            # Skip unreadable directories, e.g. "System Volume Information" on Windows drives
+            continue
 
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    to_scan.append(Path(entry.path))
+                    continue
 
-def build_cli_cmd(
+                suffix = os.path.splitext(entry.name)[1].lower()
+                if suffix == ".fit":
+                    fit_files.append(Path(entry.path))
+                elif suffix == ".json":
+                    json_files.add(Path(entry.path))
+
+    return fit_files, json_files
+
+
+def build_cli_argv(
     in_filepath: Path,
     out_filepath: Union[Path, None] = None,
     sort_order: str = SORT_ORDER,
-    fields_to_export: List = FIELDS_TO_EXPORT.keys(),
-    converter_path: Path = PATH_TO_CONVERTER,
-) -> str:
-    """Build the CLI command string from the provided parameters to pass to GMetrixConverter."""
+    fields_to_export: Optional[Iterable[str]] = None,
+    converter_path: Optional[Path] = None,
+) -> List[str]:
+    """
+    Build the GMetrixConverter argument list from the provided parameters.
+
+    If not specified, `fields_to_export` defaults to the keys of `FIELDS_TO_EXPORT` and
+    `converter_path` defaults to `PATH_TO_CONVERTER`.
+    """
     if not out_filepath:
         # If a new output filename is not provided, mirror the input filename
         out_filepath = in_filepath.with_suffix(".json")
 
-    return (
-        f'"{converter_path}" -i "{in_filepath}" -o "{out_filepath}" '
-        f"-s {sort_order} -d {' '.join(fields_to_export)}"
-    )
+    converter = _CONVERTER_STR if converter_path is None else str(converter_path)
+    if sort_order == SORT_ORDER and fields_to_export is None:
+        # Use the default options prebuilt at import rather than rebuilding them for every file
+        options = _CONVERTER_OPTIONS
+    else:
+        fields = FIELDS_TO_EXPORT if fields_to_export is None else fields_to_export
+        options = ("-s", sort_order, "-d", *fields)
+
+    return [converter, "-i", str(in_filepath), "-o", str(out_filepath), *options]
+
+
+def build_cli_cmd(*args, **kwargs) -> str:
+    """
+    Build the CLI command string to pass to GMetrixConverter, e.g. for manual invocation.
+
+    Arguments are passed through to `build_cli_argv`.
+    """
+    return subprocess.list2cmdline(build_cli_argv(*args, **kwargs))
 
 
 def call_converter(in_filepath: Path) -> None:
-    """Call the GMetrix Converter for the provided filepath."""
-    subprocess.run(build_cli_cmd(in_filepath))
+    """
+    Call the GMetrix Converter for the provided filepath.
+
+    The output JSON mirrors the input filename. `subprocess.CalledProcessError` is raised if the
+    converter exits with a non-zero return code.
+    """
+    # Have the converter write to a partial file & move it into place once complete, so a failed
+    # or interrupted conversion can't leave behind a truncated JSON that's skipped on later runs
+    out_filepath = in_filepath.with_suffix(".json")
+    partial_filepath = _partial_filepath(out_filepath)
+    try:
+        subprocess.run(build_cli_argv(in_filepath, partial_filepath), shell=False, check=True)
+        os.replace(partial_filepath, out_filepath)
+    except BaseException:
+        if partial_filepath.exists():
+            partial_filepath.unlink()
+        raise
+
 
+def _partial_filepath(out_filepath: Path) -> Path:
+    """Build the hidden path an output file is written to before being moved into place."""
+    return out_filepath.with_name(f".{out_filepath.stem}.partial{out_filepath.suffix}")
 
-def fit_json_to_excel(in_filepath: Path) -> None:
+
+def fit_json_to_table(in_filepath: Path, sink: str = "csv") -> None:
     """
-    Convert Garmin Virb data JSON to an *.xlsx.
+    Convert Garmin Virb data JSON to a table file of the format specified by `sink`.
+
+    `sink` must be one of `OUTPUT_FORMATS`; the output file mirrors the input filename with the
+    suffix swapped for the output format. Parquet output requires `pyarrow`, and *.xlsx output is
+    streamed to disk if `xlsxwriter` is available.
 
     Data is output by Garmin's GMetrixConverter as a JSON of the following sample form:
         {
@@ -109,32 +311,271 @@ def fit_json_to_excel(in_filepath: Path) -> None:
             ]
         }
     """
-    with in_filepath.open("r") as f:
-        raw_data = json.load(f)
+    if sink not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{sink}', expected one of {OUTPUT_FORMATS}")
+
+    import pandas as pd
+
+    with in_filepath.open("rb") as f:
+        metadata, typedata = _read_fit_json(f)
+        start_time = _parse_timestamp(metadata["startTime"])
+
+        # Collect the per-type columns & combine once, rather than growing a frame in the loop
+        columns = []
+        # Type groups largely share sample times, so each reuses the prior group's parsed times
+        parsed_times = None
+        for data_type in typedata:
+            values = data_type["values"]
+            if not values:
+                continue
+
+            # Each sample holds its time & a single value, so split these into columns directly
+            # rather than having pandas infer the columns from a list of row dicts
+            value_key = next(key for key in values[0] if key != "time")
+            times = [sample["time"] for sample in values]
+            samples = _extract_samples(values, value_key, data_type["type"])
+
+            index, parsed_times = _time_since_start(times, start_time, parsed_times)
+            columns.append(pd.Series(samples, index=index, name=data_type["type"]))
+
+    all_dfs = _combine_columns(columns)
+
+    # Write to a partial file & move it into place once complete, so an interrupted write can't
+    # leave behind a truncated output that looks up to date on the next run
+    out_filepath = in_filepath.with_suffix(f".{sink}")
+    partial_filepath = _partial_filepath(out_filepath)
+    try:
+        if sink == "csv":
+            all_dfs.to_csv(partial_filepath)
+        elif sink == "parquet":
+            all_dfs.to_parquet(partial_filepath, engine="pyarrow", compression="zstd")
+        else:
+            _write_xlsx(all_dfs, partial_filepath)
+
+        os.replace(partial_filepath, out_filepath)
+    except BaseException:
+        if partial_filepath.exists():
+            partial_filepath.unlink()
+        raise
+
+
+def _extract_samples(values: List[Dict], value_key: str, type_name: str) -> Union[np.ndarray, List]:
+    """
+    Extract the `value_key` sample from each of the provided typedata values.
+
+    Samples of known scalar types are read straight into a float64 array, so these columns have a
+    stable dtype regardless of how their values happen to be represented in the JSON. Anything
+    else, or any scalar group that can't be read as floats (e.g. missing samples), is returned as
+    a list for pandas to infer.
+    """
+    import numpy as np
+
+    if type_name in _SCALAR_TYPES:
+        try:
+            return np.fromiter(
+                (sample[value_key] for sample in values), dtype=np.float64, count=len(values)
+            )
+        except (KeyError, TypeError, ValueError):
+            pass
+
+    return [sample.get(value_key) for sample in values]
+
+
+def _combine_columns(columns: List[pd.Series]) -> pd.DataFrame:
+    """
+    Outer join the provided per-type series on their time index into a single DataFrame.
+
+    Each type is sampled on its own time base, so rather than leaving the alignment to
+    `pd.concat`, every series is reindexed onto the union of all time indices & the resulting
+    arrays are stacked into the output frame directly.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # Only align real columns, there's nothing to align if there's zero or one of them
+    if not columns:
+        return pd.DataFrame()
+    elif len(columns) == 1:
+        return columns[0].to_frame()
+
+    union_idx = reduce(lambda left, right: left.union(right), (col.index for col in columns))
+    aligned = [col.reindex(union_idx).to_numpy() for col in columns]
+    names = [col.name for col in columns]
+
+    if len({arr.dtype for arr in aligned}) == 1:
+        # Homogeneous columns can be stacked straight into a single 2D block
+        return pd.DataFrame(np.column_stack(aligned), index=union_idx, columns=names)
+    else:
+        # Stacking mixed dtypes would upcast every column to object, so keep them separate
+        # Columns are keyed by position, then named, so any groups sharing a type name are kept
+        combined = pd.DataFrame(dict(enumerate(aligned)), index=union_idx)
+        combined.columns = names
+        return combined
+
+
+def _write_xlsx(df: pd.DataFrame, out_filepath: Path) -> None:
+    """
+    Write the provided DataFrame, with its index as the first column, to an *.xlsx file.
+
+    If `xlsxwriter` is available, the workbook is written in its `constant_memory` mode, which
+    flushes each row to disk once the next one is started rather than holding the full sheet in
+    memory. This mode only supports writing row by row, whereas `DataFrame.to_excel` writes cells
+    column by column (silently dropping all but the final row), so the rows are written directly.
+    Otherwise, this falls back to `DataFrame.to_excel`.
+    """
+    try:
+        import xlsxwriter
+    except ImportError:
+        df.to_excel(out_filepath)
+        return
+
+    with xlsxwriter.Workbook(str(out_filepath), {"constant_memory": True}) as workbook:
+        worksheet = workbook.add_worksheet()
+        worksheet.write_row(0, 0, [df.index.name, *df.columns])
+        for row_idx, row in enumerate(df.itertuples(name=None), start=1):
+            worksheet.write_row(row_idx, 0, [_xlsx_cell(value) for value in row])
+
+
+def _xlsx_cell(value: object) -> object:
+    """Coerce the provided DataFrame value into one `xlsxwriter` can write; NaN is left blank."""
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    elif isinstance(value, Number):
+        return None if math.isnan(value) else value
+    else:
+        return str(value)
+
+
+def _read_fit_json(f: BinaryIO) -> Tuple[Dict, Iterable[Dict]]:
+    """
+    Read the metadata & typedata sections from the provided GMetrixConverter JSON file object.
+
+    If `ijson` (>= 3.1) is available, the typedata groups are lazily parsed one at a time as they
+    are iterated over, so the full document is never held in memory; otherwise the entire JSON is
+    loaded up front, using `orjson` if it is available. In the former case, `f` must remain open
+    while typedata is consumed.
+
+    Streaming deliberately takes precedence over `orjson` when both are installed, as it bounds
+    memory use for large files at the cost of some parsing speed.
+    """
+    if ijson is None:
+        raw_data = _loads(f.read())
+        return raw_data["metadata"], raw_data["typedata"]
 
-    start_time = parse(raw_data["metadata"]["startTime"])
+    # Mirror the errors raised by indexing the fully loaded JSON if either section is missing
+    events = ijson.parse(f, use_float=True)
+    metadata = next(ijson.items(events, "metadata"), None)
+    if metadata is None:
+        raise KeyError("metadata")
 
-    all_dfs = pd.DataFrame()
-    for data_type in raw_data["typedata"]:
-        test = pd.DataFrame(data_type["values"])
-        test["time"] = test["time"].apply(_time_since_start, args=[start_time])
-        test.set_index("time", inplace=True)
-        test.columns = [data_type["type"]]
-        all_dfs = pd.concat([all_dfs, test], axis=1, sort=False)
+    # Reading the metadata leaves the parser just past its block, where GMetrixConverter places the
+    # typedata, so checking the remaining top level keys for it is cheap
+    if not any(
+        prefix == "" and event == "map_key" and value == "typedata"
+        for prefix, event, value in events
+    ):
+        raise KeyError("typedata")
 
-    out_filepath = in_filepath.with_suffix(".xlsx")
-    all_dfs.to_excel(out_filepath)
+    f.seek(0)
+    return metadata, ijson.items(f, "typedata.item", use_float=True)
 
 
-def _time_since_start(timestamp: str, start_time: dt) -> float:
-    timestamp = parse(timestamp)
-    delta = timestamp - start_time
-    return delta.total_seconds()
+def _parse_timestamp(timestamp: str) -> dt:
+    """
+    Parse the provided ISO 8601 timestamp string.
+
+    Any unpadded date & time fields are zero-padded so a strict ISO 8601 parser (`ciso8601` if it
+    is available, otherwise `datetime.fromisoformat`) can be used, falling back to dateutil for
+    timestamps it still rejects.
+    """
+    try:
+        return _fast_parse(_UNPADDED_FIELD.sub(r"0\1", timestamp))
+    except ValueError:
+        from dateutil.parser import parse
+
+        return parse(timestamp)
+
+
+def _time_since_start(
+    timestamps: List[str], start_time: dt, cache: Optional[pd.Series] = None
+) -> Tuple[pd.Index, pd.Series]:
+    """
+    Convert the provided timestamp strings to a "time" index of seconds elapsed since `start_time`.
+
+    `cache` maps already parsed timestamp strings to their elapsed seconds, e.g. the mapping
+    returned for the previous type group; timestamps found in it aren't parsed again. The mapping
+    for the provided timestamps is returned alongside the index for reuse by the next call.
+
+    Deduplication, cache lookup & expansion back to the full timestamp list are all vectorized, and
+    the cache is only searched if a sample of the timestamps shows some overlap with it.
+    """
+    import numpy as np
+    import pandas as pd
+
+    codes, uniques = pd.factorize(np.asarray(timestamps, dtype=object))
+    deltas = np.empty(len(uniques), dtype=np.float64)
+
+    unseen = np.ones(len(uniques), dtype=bool)
+    if cache is not None:
+        sample = uniques[:: max(1, len(uniques) // _CACHE_PROBE_SIZE)]
+        if (cache.index.get_indexer(sample) != -1).any():
+            positions = cache.index.get_indexer(uniques)
+            unseen = positions == -1
+            deltas[~unseen] = cache.to_numpy()[positions[~unseen]]
+
+    if unseen.any():
+        unseen_utc = _to_utc_datetime64(uniques[unseen])
+        start_utc = pd.Timestamp(start_time).to_datetime64()
+        deltas[unseen] = (unseen_utc - start_utc) / np.timedelta64(1, "s")
+
+    # Missing timestamps are given a -1 code by factorize, so leave these as NaN rather than letting
+    # them index the final unique timestamp
+    elapsed = np.full(len(codes), np.nan)
+    present = codes != -1
+    elapsed[present] = deltas[codes[present]]
+
+    return pd.Index(elapsed, name="time"), pd.Series(deltas, index=pd.Index(uniques))
+
+
+def _to_utc_datetime64(timestamps: Union[List[str], np.ndarray]) -> np.ndarray:
+    """
+    Parse the provided ISO 8601 timestamp strings into a UTC datetime64 array.
+
+    pandas >= 2.0 infers a single format from the first timestamp unless told the inputs are
+    ISO 8601, so mixed precision timestamps (e.g. with & without fractional seconds) would be
+    rejected. Anything pandas can't parse falls back to `_parse_timestamp` for each timestamp.
+    """
+    import pandas as pd
+
+    try:
+        if int(pd.__version__.split(".")[0]) >= 2:
+            return pd.to_datetime(timestamps, utc=True, format="ISO8601").values
+        else:
+            return pd.to_datetime(timestamps, utc=True).values
+    except ValueError:
+        parsed = [_parse_timestamp(timestamp) for timestamp in timestamps]
+        return pd.to_datetime(parsed, utc=True).values
 
 
 @click.command()
 @click.option("-d", "--datadir", default=None, help="Top level data directory")
-def cli(datadir: Union[str, None]):
+@click.option(
+    "-s",
+    "--sink",
+    type=click.Choice(OUTPUT_FORMATS),
+    default="csv",
+    show_default=True,
+    help="Output table format",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=os.cpu_count(),
+    show_default=True,
+    help="Number of files to convert in parallel",
+)
+def cli(datadir: Union[str, None], sink: str, jobs: int):
     """
     CLI Userflow.
 
@@ -144,13 +585,18 @@ def cli(datadir: Union[str, None]):
     if not datadir:
         # Generate a Tk file selection dialog to select the top level data dir
         # if none is provided on the CLI
+        import tkinter as tk
+        from tkinter import filedialog
+
         root = tk.Tk()
         root.withdraw()
         datadir = Path(filedialog.askdirectory(title="Select Data Directory"))
     else:
         datadir = Path(datadir)
 
-    processing_pipeline(datadir)
+    failed = processing_pipeline(datadir, sink, jobs)
+    if failed:
+        click.echo(f"{len(failed)} file(s) failed to convert, see {datadir / LOG_FILENAME}")
 
 
 if __name__ == "__main__":